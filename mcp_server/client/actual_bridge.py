@@ -1,77 +1,176 @@
+import asyncio
 import httpx
+import orjson
 import os
 import logging
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Settings are read once at import rather than on every client construction
+ACTUAL_BRIDGE_URL = os.getenv(
+    "ACTUAL_BRIDGE_URL",
+    "http://actual-bridge:3000"
+).rstrip('/')
+ACTUAL_SYNC_ID = os.getenv("ACTUAL_SYNC_ID", None)
+ACTUAL_FILE_PASSWORD = os.getenv("ACTUAL_FILE_PASSWORD", None)
+BRIDGE_API_KEY = os.getenv("BRIDGE_API_KEY", None)
+# HTTP/2 multiplexes concurrent requests over one connection; only useful
+# when the bridge sits behind a TLS-terminating proxy that speaks h2
+BRIDGE_HTTP2 = os.getenv("BRIDGE_HTTP2", "false").lower() in ("1", "true", "yes")
+# All traffic goes to one host, so keep every pooled connection alive
+# rather than evicting warm sockets. With HTTP/2 many requests share each
+# connection, so a handful is enough.
+BRIDGE_MAX_CONN = int(os.getenv("BRIDGE_MAX_CONN", "4" if BRIDGE_HTTP2 else "64"))
+BRIDGE_KEEPALIVE = int(os.getenv("BRIDGE_KEEPALIVE", str(BRIDGE_MAX_CONN)))
+# Seconds an idle pooled connection is kept before being closed
+BRIDGE_KEEPALIVE_EXPIRY = float(os.getenv("BRIDGE_KEEPALIVE_EXPIRY", "300"))
+
+# Streamed reads prefer newline-delimited JSON and fall back to a JSON array
+_NDJSON = "application/x-ndjson"
+_STREAM_HEADERS = {"accept": f"{_NDJSON}, application/json;q=0.9"}
+
+# Process-wide HTTP client shared by every ActualBridgeClient, so tool calls
+# reuse pooled keep-alive connections instead of reconnecting each time.
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create the httpx client used to talk to actual-bridge"""
+    headers = {}
+
+    # Add API key for actual-bridge authentication
+    if BRIDGE_API_KEY:
+        headers["x-api-key"] = BRIDGE_API_KEY
+
+    # Add sync_id header if provided
+    if ACTUAL_SYNC_ID:
+        headers["x-actual-sync-id"] = ACTUAL_SYNC_ID
+
+    # Add file password header if provided
+    if ACTUAL_FILE_PASSWORD:
+        headers["x-actual-file-password"] = ACTUAL_FILE_PASSWORD
+
+    return httpx.AsyncClient(
+        base_url=ACTUAL_BRIDGE_URL,
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=None),
+        verify=False,  # Skip SSL verification for self-signed certificates
+        headers=headers,
+        http2=BRIDGE_HTTP2,
+        limits=httpx.Limits(
+            max_connections=BRIDGE_MAX_CONN,
+            max_keepalive_connections=BRIDGE_KEEPALIVE,
+            keepalive_expiry=BRIDGE_KEEPALIVE_EXPIRY
+        )
+    )
 
-class ActualBridgeClient:
-    """HTTP client to communicate with actual-bridge API"""
-
-    def __init__(self):
-        # Read from environment variable with fallback
-        self.base_url = os.getenv(
-            "ACTUAL_BRIDGE_URL",
-            "http://actual-bridge:3000"
-        ).rstrip('/')
-        self.sync_id = os.getenv("ACTUAL_SYNC_ID", None)
-        self.file_password = os.getenv("ACTUAL_FILE_PASSWORD", None)
-        self.bridge_api_key = os.getenv("BRIDGE_API_KEY", None)
-        self.timeout = 30
-        self._client: httpx.AsyncClient = None
 
-    async def __aenter__(self):
-        headers = {}
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use.
 
-        # Add API key for actual-bridge authentication
-        if self.bridge_api_key:
-            headers["x-api-key"] = self.bridge_api_key
+    A client is bound to the event loop it was created on, so a new one is
+    built when called from a different loop.
+    """
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = _build_client()
+        _shared_loop = loop
+    return _shared_client
 
-        # Add sync_id header if provided
-        if self.sync_id:
-            headers["x-actual-sync-id"] = self.sync_id
 
-        # Add file password header if provided
-        if self.file_password:
-            headers["x-actual-file-password"] = self.file_password
+async def close_client():
+    """Close the shared httpx client (called on server shutdown)"""
+    global _shared_client, _shared_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
 
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=False,  # Skip SSL verification for self-signed certificates
-            headers=headers
-        )
+
+class ActualBridgeClient:
+    """HTTP client to communicate with actual-bridge API
+
+    All instances share one pooled httpx client (see get_client()). The async
+    context manager is kept for backward compatibility and does nothing.
+    """
+
+    async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        pass
+
+    async def _request(self, method: str, path: str, *, json=None, stream: bool = False):
+        """Send one request to actual-bridge and return the decoded JSON body
+
+        Args:
+            method: HTTP method
+            path: Path relative to ACTUAL_BRIDGE_URL
+            json: Optional JSON request body
+            stream: Read the body in chunks (for large results), accepting
+                NDJSON from bridges that can send one row per line
+        """
+        client = await get_client()
+
+        if not stream:
+            response = await client.request(method, path, json=json)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        async with client.stream(method, path, json=json, headers=_STREAM_HEADERS) as response:
+            response.raise_for_status()
+            if response.headers.get("content-type", "").startswith(_NDJSON):
+                # One JSON row per line: decode rows as they arrive instead
+                # of buffering the whole body first
+                rows = []
+                pending = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    end = chunk.rfind(b"\n")
+                    if end == -1:
+                        # Still inside a line; only search the new bytes next time
+                        pending.extend(chunk)
+                        continue
+                    pending.extend(chunk[:end])
+                    self._decode_ndjson(pending, rows, path)
+                    pending = bytearray(chunk[end + 1:])
+                self._decode_ndjson(pending, rows, path)
+                return rows
+
+            # Plain JSON: stream the body into one buffer instead of keeping
+            # it on the response object alongside the parsed result
+            body = bytearray()
+            async for chunk in response.aiter_bytes(65536):
+                body.extend(chunk)
+        return orjson.loads(body)
+
+    @staticmethod
+    def _decode_ndjson(lines: bytearray, rows: list, path: str):
+        """Append the rows in a block of complete NDJSON lines to rows"""
+        for line in lines.split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                rows.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                raise ValueError(
+                    f"Invalid NDJSON row {len(rows) + 1} from actual-bridge {path}: {e}"
+                ) from e
 
     async def get_accounts(self):
         """GET /mcp/accounts - Returns [{id, name, type, balance}]"""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
-        response = await self._client.get(f"{self.base_url}/mcp/accounts")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", "/mcp/accounts")
 
     async def get_categories(self):
         """GET /mcp/categories - Returns [{id, name}]"""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
-        response = await self._client.get(f"{self.base_url}/mcp/categories")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", "/mcp/categories")
 
     async def add_transaction(self, account, amount, date, notes=None, payee=None, category=None):
         """POST /mcp/transactions/add - Add a transaction
 
         Note: actual-bridge handles name-to-ID lookup internally!
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
         payload = {
             "account": account,  # Can be NAME or ID - bridge handles lookup
             "amount": amount,    # Decimal (e.g., -8.50) - bridge converts to cents
@@ -84,12 +183,7 @@ class ActualBridgeClient:
         if category:
             payload["category"] = category     # Can be NAME or ID
 
-        response = await self._client.post(
-            f"{self.base_url}/mcp/transactions/add",
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._request("POST", "/mcp/transactions/add", json=payload)
 
     async def edit_transaction(self, transaction_id: str, amount: float = None,
                               date: str = None, category: str = None,
@@ -109,9 +203,6 @@ class ActualBridgeClient:
         Returns:
             Updated transaction object
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
         payload = {}
         if amount is not None:
             payload["amount"] = amount
@@ -126,12 +217,11 @@ class ActualBridgeClient:
         if account:
             payload["account"] = account
 
-        response = await self._client.put(
-            f"{self.base_url}/mcp/transactions/{transaction_id}",
+        return await self._request(
+            "PUT",
+            f"/mcp/transactions/{quote(transaction_id, safe='')}",
             json=payload
         )
-        response.raise_for_status()
-        return response.json()
 
     async def delete_transaction(self, transaction_id: str):
         """DELETE /mcp/transactions/:id - Delete a transaction
@@ -142,18 +232,14 @@ class ActualBridgeClient:
         Returns:
             Confirmation of deletion
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
-        response = await self._client.delete(
-            f"{self.base_url}/mcp/transactions/{transaction_id}"
+        return await self._request(
+            "DELETE",
+            f"/mcp/transactions/{quote(transaction_id, safe='')}"
         )
-        response.raise_for_status()
-        return response.json()
 
     async def query_transactions(
         self,
-        accounts: str | list[str] = None,
+        accounts: tuple[str, ...] = (),
         category: str = None,
         start_date: str = None,
         end_date: str = None,
@@ -164,8 +250,11 @@ class ActualBridgeClient:
     ):
         """POST /mcp/transactions/query - Query transactions with flexible filters
 
+        Every filter, including search and limit, is sent to actual-bridge and
+        applied there; nothing is filtered client-side.
+
         Args:
-            accounts: Account name(s) - single string or list of strings (default: all accounts)
+            accounts: Account names to include (default: all accounts)
             category: Category name to filter by
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
@@ -177,9 +266,6 @@ class ActualBridgeClient:
         Returns:
             List of transactions matching criteria
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
         payload = {"limit": limit}
 
         if accounts:
@@ -197,9 +283,5 @@ class ActualBridgeClient:
         if search:
             payload["search"] = search
 
-        response = await self._client.post(
-            f"{self.base_url}/mcp/transactions/query",
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+        # Results can be large, so stream them
+        return await self._request("POST", "/mcp/transactions/query", json=payload, stream=True)
@@ -6,53 +6,397 @@ A Model Context Protocol server that exposes Actual Budget functionality
 as MCP tools, communicating with the actual-bridge HTTP API.
 """
 
+import asyncio
+import atexit
+import difflib
+import functools
 import logging
-from fastmcp import FastMCP
-from mcp_server.client.actual_bridge import ActualBridgeClient
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import logging.handlers
+import orjson
+import os
+import queue
+import time
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Annotated, Any, Awaitable, Callable, Hashable, Mapping
+from fastmcp import FastMCP, Context
+from fastmcp.server.dependencies import without_injected_parameters
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter
+from pydantic_core import ArgsKwargs
+from mcp_server.client.actual_bridge import ActualBridgeClient, close_client, get_client
+from mcp_server.utils import parse_date
+
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Provide the actual-bridge client for the lifetime of the server.
+
+    Tools share its connection pool instead of paying a new TCP/TLS
+    handshake on every call. The pool is built at startup, so the first
+    tool call does not pay for it, and closed on shutdown.
+    """
+    await get_client()
+    try:
+        yield {"bridge": ActualBridgeClient()}
+    finally:
+        await close_client()
+
+
+def _check_date(date: str) -> str:
+    """Raise a ValueError with a usable message unless date is a real YYYY-MM-DD date"""
+    try:
+        parse_date(date)
+    except ValueError:
+        raise ValueError(f"Invalid date '{date}'. Use YYYY-MM-DD format.") from None
+    return date
+
+
+# 'YYYY-MM-DD' date string, validated by FastMCP before the tool runs
+IsoDate = Annotated[str, Field(pattern=r"^\d{4}-\d{2}-\d{2}$"), AfterValidator(_check_date)]
+
+
+def _serialize(data: Any) -> str:
+    """Serialize tool results to JSON text with orjson"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create FastMCP server instance
-mcp = FastMCP("actual-budget-mcp-server")
+mcp = FastMCP("actual-budget-mcp-server", lifespan=lifespan, tool_serializer=_serialize)
+
+
+def _bridge(ctx: Context) -> ActualBridgeClient:
+    """Return the shared actual-bridge client opened by the lifespan"""
+    return ctx.request_context.lifespan_context["bridge"]
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+# Seconds to keep results before asking actual-bridge again. Balances change
+# with every transaction; categories almost never change.
+ACCOUNTS_CACHE_TTL = float(os.getenv("ACCOUNTS_CACHE_TTL", "60"))
+CATEGORIES_CACHE_TTL = float(os.getenv("CATEGORIES_CACHE_TTL", "300"))
+# query_transactions results only need to survive a conversational turn
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "15"))
+QUERY_CACHE_MAX = 256
+
+# key -> (expires_at, value)
+_cache: dict[str, tuple[float, Any]] = {}
+
+
+def _cache_get(key: str) -> Any:
+    """Return the cached value for key, or None if missing or expired"""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        del _cache[key]
+        return None
+    return value
+
+
+def _cache_set(key: str, value: Any, ttl: float):
+    _cache[key] = (time.monotonic() + ttl, value)
+
+
+def _cache_invalidate(key: str):
+    _cache.pop(key, None)
+
+
+# Bumped by every write and cache clear. A read that started under an older
+# generation may carry pre-write data, so its result is not cached.
+_write_generation = 0
+
+
+def _cache_clear():
+    global _write_generation
+    _write_generation += 1
+    _cache.clear()
+    _query_cache.clear()
+
+
+# normalized query filters -> (expires_at, rows); dropped on every write
+_query_cache: dict[Hashable, tuple[float, list]] = {}
+
+
+def _query_cache_get(key: Hashable) -> list | None:
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, rows = entry
+    if time.monotonic() >= expires_at:
+        del _query_cache[key]
+        return None
+    return rows
+
+
+def _query_cache_set(key: Hashable, rows: list):
+    if len(_query_cache) >= QUERY_CACHE_MAX:
+        # Dicts keep insertion order, so this evicts the oldest entry
+        del _query_cache[next(iter(_query_cache))]
+    _query_cache[key] = (time.monotonic() + QUERY_CACHE_TTL, rows)
+
+
+def _invalidate_after_write():
+    """Drop cached data that a transaction write may have changed"""
+    global _write_generation
+    _write_generation += 1
+    _get_accounts.cache_clear()  # Balances changed
+    _query_cache.clear()
+
+
+# Seconds a bridge read waits before being sent, so identical reads arriving
+# in a burst share it (0 disables the wait)
+COALESCE_WINDOW = float(os.getenv("COALESCE_WINDOW_MS", "0")) / 1000
+
+# key -> in-flight bridge read shared by concurrent callers
+_inflight: dict[Hashable, asyncio.Future] = {}
+
+
+async def _fetch_after_window(fetch: Callable[[], Awaitable[Any]]) -> Any:
+    if COALESCE_WINDOW:
+        await asyncio.sleep(COALESCE_WINDOW)
+    return await fetch()
+
+
+async def _single_flight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch() once for all concurrent callers asking for the same key"""
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_fetch_after_window(fetch))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled does not cancel the others
+    return await asyncio.shield(future)
+
+
+def _cached(key: str, ttl: float):
+    """Cache the result of an async fetch(ctx) under key for ttl seconds
+
+    On a miss, concurrent callers share one fetch via _single_flight(); a
+    fetch that overlaps a write is returned but not cached. The decorated
+    function gets a cache_clear() to drop the entry.
+    """
+    def decorator(fetch: Callable[[Context], Awaitable[Any]]):
+        @functools.wraps(fetch)
+        async def wrapper(ctx: Context) -> Any:
+            result = _cache_get(key)
+            if result is None:
+                # Same write-generation guard as query_transactions: never
+                # join or cache a fetch that started before a write
+                generation = _write_generation
+                result = await _single_flight((key, generation), lambda: fetch(ctx))
+                if generation == _write_generation:
+                    _cache_set(key, result, ttl)
+            return result
+
+        wrapper.cache_clear = lambda: _cache_invalidate(key)
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# Lookups & Validation
+# =============================================================================
+
+@_cached("accounts", ACCOUNTS_CACHE_TTL)
+async def _get_accounts(ctx: Context) -> list[dict]:
+    """Accounts from the cache, fetched from actual-bridge on a miss"""
+    return await _bridge(ctx).get_accounts()
+
+
+@_cached("categories", CATEGORIES_CACHE_TTL)
+async def _get_categories(ctx: Context) -> list[dict]:
+    """Categories from the cache, fetched from actual-bridge on a miss"""
+    return await _bridge(ctx).get_categories()
+
+
+class _NameIndex:
+    """Lookup of account or category names and IDs, built once per cache refresh
+
+    Exact spellings resolve to themselves; other spellings resolve through
+    their casefolded form, so 'checking' finds 'Checking' without asking
+    actual-bridge.
+    """
+
+    def __init__(self, items: list[dict]):
+        self.names = [item["name"] for item in items]
+        self.built_at = time.monotonic()
+        self._index = {}
+        # canonical name/ID -> ID
+        self._ids = {}
+        for item in items:
+            for value in (item["id"], item["name"]):
+                self._index.setdefault(value.casefold(), value)
+        for item in items:
+            self._index[item["id"]] = item["id"]
+            self._index[item["name"]] = item["name"]
+            self._ids.setdefault(item["id"], item["id"])
+            self._ids.setdefault(item["name"], item["id"])
+
+    def resolve(self, value: str) -> str | None:
+        """Return the canonical name/ID for value, or None if unknown"""
+        return self._index.get(value) or self._index.get(value.casefold())
+
+    def id_of(self, canonical: str) -> str:
+        """Return the ID for a value returned by resolve()"""
+        return self._ids[canonical]
+
+    def suggest(self, value: str) -> str | None:
+        """Return the closest known name for an unknown value, if any is close"""
+        matches = difflib.get_close_matches(value, self.names, n=1, cutoff=0.6)
+        return matches[0] if matches else None
+
+
+# Minimum index age, in seconds, before an unknown name triggers a refetch.
+# A refetch lets names created in Actual resolve without waiting out the TTL;
+# the floor keeps a model retrying typos from costing a bridge call each time
+# and from repeatedly evicting the cached list other callers are using.
+NAME_REFETCH_MIN_AGE = 10.0
+
+
+@_cached("account_names", ACCOUNTS_CACHE_TTL)
+async def _account_names(ctx: Context) -> _NameIndex:
+    """Index of all account names and IDs.
+
+    Cached separately from the account list: a write changes balances and
+    drops the list, but names and IDs survive it.
+    """
+    return _NameIndex(await _get_accounts(ctx))
+
+
+@_cached("category_names", CATEGORIES_CACHE_TTL)
+async def _category_names(ctx: Context) -> _NameIndex:
+    """Index of all category names and IDs"""
+    return _NameIndex(await _get_categories(ctx))
+
+
+async def _account_index(ctx: Context, refresh: bool = False) -> _NameIndex:
+    """Account index, rebuilt from a fresh bridge fetch with refresh"""
+    if refresh:
+        _get_accounts.cache_clear()
+        _account_names.cache_clear()
+    return await _account_names(ctx)
+
+
+async def _category_index(ctx: Context, refresh: bool = False) -> _NameIndex:
+    """Category index, rebuilt from a fresh bridge fetch with refresh"""
+    if refresh:
+        _get_categories.cache_clear()
+        _category_names.cache_clear()
+    return await _category_names(ctx)
+
+
+async def _resolve_name(ctx: Context, load_index: Callable[..., Awaitable[_NameIndex]],
+                        value: str, error: str) -> tuple[str, str]:
+    """Return (canonical spelling, ID) for value, or raise ValueError(error) with a hint"""
+    index = await load_index(ctx)
+    canonical = index.resolve(value)
+    if canonical is None and time.monotonic() - index.built_at >= NAME_REFETCH_MIN_AGE:
+        # It may have been created in Actual since the list was cached
+        index = await load_index(ctx, refresh=True)
+        canonical = index.resolve(value)
+    if canonical is None:
+        suggestion = index.suggest(value)
+        if suggestion:
+            error = f"{error} Did you mean '{suggestion}'?"
+        raise ValueError(error)
+    return canonical, index.id_of(canonical)
+
+
+async def _resolve_inputs(ctx: Context, account: str = None, payee: str = None,
+                          category: str = None, as_ids: bool = False) -> tuple[str, str, str]:
+    """Validate input locally instead of paying a bridge round-trip for the error
+
+    With as_ids, account and category are resolved to IDs so actual-bridge
+    does not have to look the names up again; only pass it for routes that
+    accept IDs. Payee stays a name: the bridge matches it against transfer
+    payees by account name.
+
+    Returns:
+        (account, payee, category) with names in their canonical spelling,
+        or account and category IDs with as_ids
+
+    Raises:
+        ValueError: If a name is unknown
+    """
+    if account:
+        name, account_id = await _resolve_name(
+            ctx, _account_index, account,
+            f"Unknown account '{account}'. Use an exact name from list_accounts()."
+        )
+        account = account_id if as_ids else name
+    if payee:
+        payee, _ = await _resolve_name(
+            ctx, _account_index, payee,
+            f"Unknown payee '{payee}'. Payee is only for transfers and must be "
+            f"an exact account name from list_accounts()."
+        )
+    if category:
+        name, category_id = await _resolve_name(
+            ctx, _category_index, category,
+            f"Unknown category '{category}'. Use an exact name from list_categories()."
+        )
+        category = category_id if as_ids else name
+    return account, payee, category
 
 
 # =============================================================================
 # Tool: List Accounts
 # =============================================================================
 
-@mcp.tool()
-async def list_accounts() -> list[dict]:
+# Read tools pass bridge data through unchanged and are registered with
+# output_schema=None: otherwise the MCP layer re-validates every returned
+# row against a generic "list of objects" JSON schema on each call.
+@mcp.tool(output_schema=None)
+async def list_accounts(ctx: Context) -> list[dict]:
     """List all accounts with their current balances.
 
     Returns:
         List of accounts with id, name, type, and balance (decimal format)
     """
-    async with ActualBridgeClient() as client:
-        result = await client.get_accounts()
-        logger.info(f"Retrieved {len(result)} accounts")
-        return result
+    result = await _get_accounts(ctx)
+    logger.info("Retrieved %d accounts", len(result))
+    return result
 
 
 # =============================================================================
 # Tool: List Categories
 # =============================================================================
 
-@mcp.tool()
-async def list_categories() -> list[dict]:
+@mcp.tool(output_schema=None)
+async def list_categories(ctx: Context) -> list[dict]:
     """List all budget categories available in Actual Budget.
 
     Returns:
         List of categories with id and name
     """
-    async with ActualBridgeClient() as client:
-        result = await client.get_categories()
-        logger.info(f"Retrieved {len(result)} categories")
-        return result
+    result = await _get_categories(ctx)
+    logger.info("Retrieved %d categories", len(result))
+    return result
+
+
+# =============================================================================
+# Tool: List Accounts and Categories
+# =============================================================================
+
+@mcp.tool(output_schema=None)
+async def list_accounts_and_categories(ctx: Context) -> dict:
+    """List all accounts and all categories in a single call.
+
+    Prefer this over calling list_accounts() and list_categories() one after
+    the other (e.g. before add_transaction): both are fetched concurrently.
+
+    Returns:
+        {"accounts": [...], "categories": [...]} - same items as list_accounts() and list_categories()
+    """
+    accounts, categories = await asyncio.gather(_get_accounts(ctx), _get_categories(ctx))
+    logger.info("Retrieved %d accounts and %d categories", len(accounts), len(categories))
+    return {"accounts": accounts, "categories": categories}
 
 
 # =============================================================================
@@ -61,12 +405,13 @@ async def list_categories() -> list[dict]:
 
 @mcp.tool()
 async def add_transaction(
+    ctx: Context,
     account: str,
     amount: float,
-    date: str,
-    notes: str = None,
-    payee: str = None,
-    category: str = None
+    date: IsoDate,
+    notes: str | None = None,
+    payee: str | None = None,
+    category: str | None = None
 ) -> dict:
     """Add a new transaction to Actual Budget.
 
@@ -77,6 +422,8 @@ async def add_transaction(
     4. notes: For purchases/expense descriptions (e.g., "coffee", "groceries")
     5. date: YYYY-MM-DD format
 
+    TIP: Get valid account and category names with one list_accounts_and_categories() call.
+
     DIFFERENTIATING PURCHASES vs TRANSFERS:
     - PURCHASE: Use 'notes' field with description, leave 'payee' empty
                 Example: add_transaction(account='Checking', amount=-10.50, date='2025-01-19', notes='coffee')
@@ -94,10 +441,100 @@ async def add_transaction(
     Returns:
         Confirmation with transaction details including generated ID
     """
-    async with ActualBridgeClient() as client:
-        result = await client.add_transaction(account, amount, date, notes, payee, category)
-        logger.info(f"Added transaction: {result.get('transaction', {})}")
-        return result
+    account, payee, category = await _resolve_inputs(
+        ctx, account=account, payee=payee, category=category, as_ids=True
+    )
+
+    client = _bridge(ctx)
+    result = await client.add_transaction(account, amount, date, notes, payee, category)
+    _invalidate_after_write()
+    logger.info("Added transaction: %s", result.get("transaction", {}))
+    return result
+
+
+# =============================================================================
+# Tool: Add Transactions (Bulk)
+# =============================================================================
+
+# Upper bound on transactions per bulk call
+BULK_MAX_TRANSACTIONS = 50
+
+# Bulk adds sent to actual-bridge at the same time. The bridge writes to one
+# budget file, so parallel adds gain little; the default of 1 inserts in
+# input order.
+BULK_CONCURRENCY = max(1, int(os.getenv("BULK_CONCURRENCY", "1")))
+
+
+class NewTransaction(BaseModel):
+    """One transaction for add_transactions_bulk (same rules as add_transaction)"""
+    account: str
+    amount: float
+    date: IsoDate
+    notes: str | None = None
+    payee: str | None = None
+    category: str | None = None
+
+
+@mcp.tool()
+async def add_transactions_bulk(ctx: Context, transactions: list[NewTransaction]) -> dict:
+    """Add several transactions to Actual Budget in one call.
+
+    Use this instead of repeated add_transaction calls, e.g. when importing a
+    day's receipts. Every transaction follows the same CRITICAL CONSTRAINTS as
+    add_transaction. A failing transaction does not stop the others.
+
+    Args:
+        transactions: REQUIRED - List of transactions (max 50), each with
+                      account, amount, date and optional notes, payee, category
+
+    Returns:
+        Per-transaction results in input order: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+    """
+    if len(transactions) > BULK_MAX_TRANSACTIONS:
+        raise ValueError(f"Too many transactions: {len(transactions)} (max {BULK_MAX_TRANSACTIONS})")
+
+    # Resolve every entry's names before the first write, against one
+    # cached index, instead of once per add
+    resolved = []
+    for txn in transactions:
+        try:
+            resolved.append(await _resolve_inputs(
+                ctx, account=txn.account, payee=txn.payee, category=txn.category, as_ids=True
+            ))
+        except ValueError as e:
+            resolved.append(e)
+
+    client = _bridge(ctx)
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def add_one(txn: NewTransaction, names: tuple[str, str, str] | ValueError):
+        if isinstance(names, ValueError):
+            raise names
+        account, payee, category = names
+        async with semaphore:
+            return await client.add_transaction(account, txn.amount, txn.date, txn.notes, payee, category)
+
+    try:
+        results = await asyncio.gather(
+            *(add_one(txn, names) for txn, names in zip(transactions, resolved)),
+            return_exceptions=True
+        )
+    finally:
+        _invalidate_after_write()
+
+    responses = []
+    for result in results:
+        if isinstance(result, Exception):
+            responses.append({"ok": False, "error": str(result)})
+        else:
+            responses.append({"ok": True, "result": result})
+    added = sum(1 for r in responses if r["ok"])
+    logger.info("Added %d of %d transactions in bulk", added, len(transactions))
+    return {
+        "ok": added == len(transactions),
+        "results": responses,
+        "message": f"✅ Added {added} of {len(transactions)} transactions"
+    }
 
 
 # =============================================================================
@@ -106,9 +543,10 @@ async def add_transaction(
 
 @mcp.tool()
 async def edit_transaction(
+    ctx: Context,
     transaction_id: str,
     amount: float = None,
-    date: str = None,
+    date: IsoDate | None = None,
     category: str = None,
     notes: str = None,
     cleared: bool = None,
@@ -135,11 +573,14 @@ async def edit_transaction(
     Returns:
         Updated transaction details
     """
-    async with ActualBridgeClient() as client:
-        result = await client.edit_transaction(transaction_id, amount, date,
-                                               category, notes, cleared, account)
-        logger.info(f"Edited transaction {transaction_id}")
-        return result
+    account, _, category = await _resolve_inputs(ctx, account=account, category=category)
+
+    client = _bridge(ctx)
+    result = await client.edit_transaction(transaction_id, amount, date,
+                                           category, notes, cleared, account)
+    _invalidate_after_write()
+    logger.info("Edited transaction %s", transaction_id)
+    return result
 
 
 # =============================================================================
@@ -147,7 +588,7 @@ async def edit_transaction(
 # =============================================================================
 
 @mcp.tool()
-async def delete_transaction(transaction_id: str) -> dict:
+async def delete_transaction(ctx: Context, transaction_id: str) -> dict:
     """Delete a transaction from Actual Budget.
 
     WARNING: This action cannot be undone!
@@ -158,22 +599,111 @@ async def delete_transaction(transaction_id: str) -> dict:
     Returns:
         Confirmation of deletion
     """
-    async with ActualBridgeClient() as client:
-        result = await client.delete_transaction(transaction_id)
-        logger.info(f"Deleted transaction {transaction_id}")
-        return result
+    client = _bridge(ctx)
+    result = await client.delete_transaction(transaction_id)
+    _invalidate_after_write()
+    logger.info("Deleted transaction %s", transaction_id)
+    return result
 
 
 # =============================================================================
 # Tool: Query Transactions
 # =============================================================================
 
-@mcp.tool()
+# Upper bound on rows per query
+QUERY_MAX_LIMIT = 1000
+
+# Transaction fields returned to the caller; the bridge may send more
+_TRANSACTION_FIELDS = ("id", "date", "amount", "payee", "notes", "category", "account")
+
+
+async def _fetch_transactions(client: ActualBridgeClient, **filters) -> list[dict]:
+    rows = await client.query_transactions(**filters)
+    return [{k: t[k] for k in _TRANSACTION_FIELDS if k in t} for t in rows]
+
+
+# Seconds a query waits for others with the same filters but a different
+# date range, so they share one bridge call (0 disables)
+QUERY_BATCH_WINDOW = float(os.getenv("QUERY_BATCH_WINDOW_MS", "0")) / 1000
+
+# query shape -> (start_date, end_date, limit, future) waiting on the window
+_query_batches: dict[Hashable, list[tuple[str | None, str | None, int, asyncio.Future]]] = {}
+
+# Running batch tasks; the event loop only keeps weak references to tasks
+_batch_tasks: set[asyncio.Task] = set()
+
+
+def _in_range(row: dict, start_date: str | None, end_date: str | None) -> bool:
+    date = row.get("date", "")
+    return (start_date is None or date >= start_date) and (end_date is None or date <= end_date)
+
+
+async def _fetch_transactions_batched(
+    client: ActualBridgeClient,
+    shape: Hashable,
+    start_date: str | None,
+    end_date: str | None,
+    limit: int,
+    filters: dict,
+) -> list[dict]:
+    """Fetch one date range, merged with same-shape queries in the window"""
+    future = asyncio.get_running_loop().create_future()
+    batch = _query_batches.get(shape)
+    if batch is None:
+        batch = _query_batches[shape] = []
+        task = asyncio.ensure_future(_run_query_batch(client, shape, filters))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+    batch.append((start_date, end_date, limit, future))
+    return await future
+
+
+async def _run_query_batch(client: ActualBridgeClient, shape: Hashable, filters: dict):
+    """Send one bridge query spanning every range in the batch, then split it"""
+    await asyncio.sleep(QUERY_BATCH_WINDOW)
+    batch = _query_batches.pop(shape)
+    starts = [start for start, _, _, _ in batch]
+    ends = [end for _, end, _, _ in batch]
+    limit = min(sum(limit for _, _, limit, _ in batch), QUERY_MAX_LIMIT)
+    try:
+        rows = await _fetch_transactions(
+            client,
+            start_date=None if None in starts else min(starts),
+            end_date=None if None in ends else max(ends),
+            limit=limit,
+            **filters,
+        )
+        if len(batch) > 1 and len(rows) >= limit:
+            # The merged result may be cut off, so slices of it could miss
+            # rows; ask for each range on its own instead
+            results = await asyncio.gather(*(
+                _fetch_transactions(client, start_date=start, end_date=end, limit=n, **filters)
+                for start, end, n, _ in batch
+            ), return_exceptions=True)
+        else:
+            results = [
+                [t for t in rows if _in_range(t, start, end)][:n]
+                for start, end, n, _ in batch
+            ]
+    except Exception as e:
+        results = [e] * len(batch)
+
+    for (_, _, _, future), result in zip(batch, results):
+        if future.done():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+@mcp.tool(output_schema=None)
 async def query_transactions(
+    ctx: Context,
     accounts: str | list[str] = None,
     category: str = None,
-    start_date: str = None,
-    end_date: str = None,
+    start_date: IsoDate | None = None,
+    end_date: IsoDate | None = None,
     min_amount: float = None,
     max_amount: float = None,
     search: str = None,
@@ -191,6 +721,9 @@ async def query_transactions(
     - max_amount: Use 0 for "expenses only", negative for "income only"
     - IMPORTANT: Use start_date and end_date for date filtering. Do NOT use a 'date' parameter.
 
+    TIP: Get valid account and category names with one list_accounts_and_categories() call,
+    or use batch_read() to fetch them together with this query in a single round-trip.
+
     Args:
         accounts: OPTIONAL - Account name(s): single string or list. Example: "Checking" or ["Checking", "Savings"]
         category: OPTIONAL - Category name filter. Example: "Food"
@@ -199,7 +732,7 @@ async def query_transactions(
         min_amount: OPTIONAL - Minimum amount (e.g., -100 for "over $100 expenses")
         max_amount: OPTIONAL - Maximum amount (e.g., 0 for "expenses only")
         search: OPTIONAL - Text search in notes/payee/description. Example: "coffee"
-        limit: OPTIONAL - Max results (default: 100)
+        limit: OPTIONAL - Max results (default: 100, at most 1000)
 
     Returns:
         List of transactions with id, date, amount, payee, notes, category, account
@@ -211,28 +744,156 @@ async def query_transactions(
         query_transactions(search='coffee')  # Search for "coffee"
         query_transactions(start_date='2025-01-01', end_date='2025-01-31')  # January
     """
-    async with ActualBridgeClient() as client:
-        result = await client.query_transactions(
-            accounts=accounts,
-            category=category,
-            start_date=start_date,
-            end_date=end_date,
-            min_amount=min_amount,
-            max_amount=max_amount,
-            search=search,
-            limit=limit
+    # Keep a stray limit from asking the bridge for the whole table
+    limit = max(1, min(limit, QUERY_MAX_LIMIT))
+
+    # All filtering happens in actual-bridge; send a trimmed search term,
+    # or none at all for a blank one
+    if search:
+        search = " ".join(search.split()) or None
+
+    # One shape for accounts downstream, usable as-is in the cache keys.
+    # Blank names are dropped: an empty filter means all accounts.
+    if isinstance(accounts, str):
+        accounts = (accounts,)
+    accounts = tuple(name for name in accounts or () if name.strip())
+    filters = {
+        "accounts": accounts,
+        "category": category,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "search": search,
+    }
+    # Everything but the date range and limit; queries sharing it can be merged
+    shape = ("query", accounts, category, min_amount, max_amount, search)
+    # Repeats within QUERY_CACHE_TTL are served from cache, and identical
+    # queries in flight at the same time share one bridge call
+    key = (*shape, start_date, end_date, limit)
+    result = _query_cache_get(key)
+    if result is None:
+        generation = _write_generation
+        client = _bridge(ctx)
+        if QUERY_BATCH_WINDOW:
+            fetch = lambda: _fetch_transactions_batched(
+                client, shape, start_date, end_date, limit, filters)
+        else:
+            fetch = lambda: _fetch_transactions(
+                client, start_date=start_date, end_date=end_date, limit=limit, **filters)
+        # Keyed by generation too, so a call made after a write does not
+        # join a fetch that started before it
+        result = await _single_flight((key, generation), fetch)
+        # A write during the fetch may have made these rows stale
+        if generation == _write_generation:
+            _query_cache_set(key, result)
+    logger.info(
+        "Queried transactions: accounts=%s category=%s dates=%s..%s search=%r - found %d results",
+        accounts, category, start_date, end_date, search, len(result)
+    )
+    # Copy so callers cannot mutate the cached list
+    return list(result)
+
+
+# =============================================================================
+# Tool: Invalidate Cache
+# =============================================================================
+
+@mcp.tool()
+async def invalidate_cache() -> dict:
+    """Clear the cached accounts, categories and query results.
+
+    Only needed after data was changed outside this server (e.g. in the
+    Actual Budget app). Transactions added, edited or deleted through this
+    server clear the affected caches automatically.
+
+    Returns:
+        Confirmation that the cache was cleared
+    """
+    _cache_clear()
+    logger.info("Cleared cache")
+    return {"ok": True, "message": "✅ Cache cleared"}
+
+
+# =============================================================================
+# Tool: Batch Read
+# =============================================================================
+
+# Read-only tools that may be combined in a single batch_read call:
+# name -> (function, accepted argument names, required argument names),
+# taken once from each tool's schema
+_READ_DISPATCH = {
+    tool.name: (
+        # Validates arguments like a direct call would, then runs tool.fn
+        TypeAdapter(without_injected_parameters(tool.fn)).validate_python,
+        frozenset(tool.parameters.get("properties", {})),
+        frozenset(tool.parameters.get("required", ())),
+    )
+    for tool in (list_accounts, list_categories, query_transactions)
+}
+
+# Upper bound on calls per batch, to keep the bridge fan-out bounded
+BATCH_MAX_CALLS = 32
+
+# Shared read-only arguments for calls that pass none, and the same empty
+# call in the form the argument validator takes
+_NO_ARGS = MappingProxyType({})
+_NO_CALL_ARGS = ArgsKwargs(())
+
+
+async def _dispatch_read(tool: str, arguments: Mapping[str, Any]):
+    """Run one read-only tool by name"""
+    try:
+        call, accepted, required = _READ_DISPATCH[tool]
+    except KeyError:
+        raise ValueError(f"Unsupported tool '{tool}'. Use one of: {', '.join(_READ_DISPATCH)}") from None
+    if not isinstance(arguments, Mapping):
+        raise ValueError(
+            f"Arguments for {tool} must be an object, not {type(arguments).__name__}"
         )
-        filters = []
-        if accounts:
-            filters.append(f"accounts={accounts}")
-        if category:
-            filters.append(f"category={category}")
-        if start_date or end_date:
-            filters.append(f"dates={start_date} to {end_date}")
-        if search:
-            filters.append(f"search='{search}'")
-        logger.info(f"Queried transactions: {', '.join(filters) if filters else 'all'} - found {len(result)} results")
-        return result
+    # Subset checks build no temporary sets on the happy path
+    if not arguments.keys() <= accepted:
+        unknown = arguments.keys() - accepted
+        raise ValueError(f"Unknown arguments for {tool}: {', '.join(sorted(unknown))}")
+    if not required <= arguments.keys():
+        missing = required - arguments.keys()
+        raise ValueError(f"Missing arguments for {tool}: {', '.join(sorted(missing))}")
+    # validate_python takes a dict or ArgsKwargs, not any Mapping
+    if not arguments:
+        return await call(_NO_CALL_ARGS)
+    return await call(arguments if isinstance(arguments, dict) else dict(arguments))
+
+
+@mcp.tool(output_schema=None)
+async def batch_read(calls: list[dict]) -> list[dict]:
+    """Run several read-only tools concurrently in a single call.
+
+    Prefer this over separate calls when you need more than one of
+    list_accounts, list_categories and query_transactions at the same time.
+    A failing call does not fail the whole batch.
+
+    Args:
+        calls: REQUIRED - List of {"tool": <name>, "arguments": {...}} objects (max 32).
+               Supported tools: list_accounts, list_categories, query_transactions
+               Example: [{"tool": "list_accounts"}, {"tool": "query_transactions", "arguments": {"category": "Food"}}]
+
+    Returns:
+        One entry per call, in order: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+    """
+    if len(calls) > BATCH_MAX_CALLS:
+        raise ValueError(f"Too many calls in batch: {len(calls)} (max {BATCH_MAX_CALLS})")
+
+    results = await asyncio.gather(
+        *(_dispatch_read(call.get("tool"), call.get("arguments") or _NO_ARGS) for call in calls),
+        return_exceptions=True
+    )
+
+    responses = []
+    for result in results:
+        if isinstance(result, Exception):
+            responses.append({"ok": False, "error": str(result)})
+        else:
+            responses.append({"ok": True, "result": result})
+    logger.info("Ran batch of %d read calls", len(calls))
+    return responses
 
 
 # =============================================================================
@@ -242,14 +903,43 @@ async def query_transactions(
 def main():
     """Main entry point for the MCP server"""
 
-    logger.info("Starting Actual Budget MCP Server...")
-    logger.info("Available tools:")
-    logger.info("  - list_accounts")
-    logger.info("  - list_categories")
-    logger.info("  - add_transaction")
-    logger.info("  - edit_transaction")
-    logger.info("  - delete_transaction")
-    logger.info("  - query_transactions")
+    # Configure logging here rather than at import, so importing this module
+    # does not reconfigure the root logger. Records go through a queue so the
+    # stderr write happens on a background thread, not the event loop.
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    logger.info(
+        "Starting Actual Budget MCP Server...\n"
+        "Available tools:\n"
+        "  - list_accounts\n"
+        "  - list_categories\n"
+        "  - list_accounts_and_categories\n"
+        "  - add_transaction\n"
+        "  - add_transactions_bulk\n"
+        "  - edit_transaction\n"
+        "  - delete_transaction\n"
+        "  - query_transactions\n"
+        "  - invalidate_cache\n"
+        "  - batch_read"
+    )
+
+    # Use uvloop for faster socket I/O when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
 
     # Run the server using STDIO transport
     # This will read JSON-RPC messages from stdin and write to stdout
@@ -0,0 +1,19 @@
+"""Shared helpers for the MCP server"""
+
+import datetime
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(value: str) -> datetime.date:
+    """Parse a 'YYYY-MM-DD' date string
+
+    Memoized: a batch of transactions usually repeats the same few dates.
+
+    Raises:
+        ValueError: If value is not a real date in YYYY-MM-DD format
+    """
+    # fromisoformat also accepts other ISO forms (e.g. '20260114'), the bridge does not
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Invalid date '{value}'")
+    return datetime.date.fromisoformat(value)
@@ -0,0 +1,146 @@
+"""Tests for resolving account and category names before writes"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server import server
+
+
+class FakeBridge:
+    """Stands in for ActualBridgeClient, recording every bridge call"""
+
+    def __init__(self):
+        self.accounts = [
+            {"id": "a1", "name": "Checking", "balance": 0.0},
+            {"id": "a2", "name": "Savings", "balance": 0.0},
+        ]
+        self.categories = [{"id": "c1", "name": "Food"}, {"id": "c2", "name": "Transport"}]
+        self.calls = []
+
+    async def get_accounts(self):
+        self.calls.append("GET /mcp/accounts")
+        return [dict(account) for account in self.accounts]
+
+    async def get_categories(self):
+        self.calls.append("GET /mcp/categories")
+        return [dict(category) for category in self.categories]
+
+    async def add_transaction(self, account, amount, date, notes=None, payee=None, category=None):
+        self.calls.append("POST /mcp/transactions/add")
+        return {"ok": True, "transaction": {"account": account, "category": category}}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    server._cache_clear()
+    yield
+    server._cache_clear()
+
+
+@pytest.fixture
+def bridge():
+    return FakeBridge()
+
+
+@pytest.fixture
+def ctx(bridge):
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context={"bridge": bridge}))
+
+
+def test_consecutive_adds_fetch_accounts_once(bridge, ctx):
+    async def run():
+        for _ in range(3):
+            await server.add_transaction.fn(ctx, account="Checking", amount=-1.0, date="2026-01-01")
+
+    asyncio.run(run())
+    # Writes drop the cached balances but not the names
+    assert bridge.calls == ["GET /mcp/accounts"] + ["POST /mcp/transactions/add"] * 3
+
+
+def test_unknown_names_do_not_refetch_a_fresh_index(bridge, ctx):
+    async def run():
+        await server._resolve_inputs(ctx, account="Checking")
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await server._resolve_inputs(ctx, account="Chequing")
+
+    asyncio.run(run())
+    assert bridge.calls == ["GET /mcp/accounts"]
+
+
+def test_bulk_add_resolves_names_once(bridge, ctx):
+    transactions = [
+        server.NewTransaction(account=account, amount=-1.0, date="2026-01-01", category=category)
+        for account, category in [
+            ("Checking", "Food"), ("savings", None), ("Nope", None), ("a1", "transport"), ("Checking", None),
+        ]
+    ]
+
+    result = asyncio.run(server.add_transactions_bulk.fn(ctx, transactions=transactions))
+    assert bridge.calls == ["GET /mcp/accounts", "GET /mcp/categories"] + ["POST /mcp/transactions/add"] * 4
+    assert [r["ok"] for r in result["results"]] == [True, True, False, True, True]
+    assert [r["result"]["transaction"] for r in result["results"] if r["ok"]] == [
+        {"account": "a1", "category": "c1"},
+        {"account": "a2", "category": None},
+        {"account": "a1", "category": "c2"},
+        {"account": "a1", "category": None},
+    ]
+    assert "Unknown account 'Nope'" in result["results"][2]["error"]
+
+
+def test_names_resolve_case_insensitively(ctx):
+    resolved = asyncio.run(server._resolve_inputs(ctx, account="checking", payee="SAVINGS", category="food"))
+    assert resolved == ("Checking", "Savings", "Food")
+
+
+def test_ids_and_names_resolve_to_ids_for_adds(ctx):
+    async def run():
+        return (
+            await server._resolve_inputs(ctx, account="Checking", category="c2", as_ids=True),
+            await server._resolve_inputs(ctx, account="a2", category="food", as_ids=True),
+        )
+
+    assert asyncio.run(run()) == (("a1", None, "c2"), ("a2", None, "c1"))
+
+
+def test_payee_stays_a_name_for_adds(ctx):
+    resolved = asyncio.run(server._resolve_inputs(ctx, account="a1", payee="savings", as_ids=True))
+    assert resolved == ("a1", "Savings", None)
+
+
+def test_unknown_name_suggests_the_closest_match(ctx):
+    with pytest.raises(ValueError, match=r"Unknown category 'Fod'\..*Did you mean 'Food'\?"):
+        asyncio.run(server._resolve_inputs(ctx, category="Fod"))
+
+
+def test_unknown_name_without_a_close_match_has_no_hint(ctx):
+    with pytest.raises(ValueError) as excinfo:
+        asyncio.run(server._resolve_inputs(ctx, account="Brokerage"))
+    assert "Did you mean" not in str(excinfo.value)
+
+
+def test_new_name_is_found_by_refetching_a_stale_index(bridge, ctx, monkeypatch):
+    monkeypatch.setattr(server, "NAME_REFETCH_MIN_AGE", 0.0)
+
+    async def run():
+        await server._resolve_inputs(ctx, account="Checking")
+        bridge.accounts.append({"id": "a3", "name": "Amex", "balance": 0.0})
+        return await server._resolve_inputs(ctx, account="amex", as_ids=True)
+
+    assert asyncio.run(run()) == ("a3", None, None)
+    assert bridge.calls == ["GET /mcp/accounts", "GET /mcp/accounts"]
+
+
+def test_hint_comes_from_the_refetched_index(bridge, ctx, monkeypatch):
+    monkeypatch.setattr(server, "NAME_REFETCH_MIN_AGE", 0.0)
+
+    async def run():
+        await server._resolve_inputs(ctx, account="Checking")
+        bridge.accounts.append({"id": "a3", "name": "Amex", "balance": 0.0})
+        await server._resolve_inputs(ctx, account="Amexx")
+
+    with pytest.raises(ValueError, match=r"Did you mean 'Amex'\?"):
+        asyncio.run(run())
+    assert bridge.calls == ["GET /mcp/accounts", "GET /mcp/accounts"]
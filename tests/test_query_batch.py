@@ -0,0 +1,122 @@
+"""Tests for merging same-shape query_transactions date ranges"""
+
+import asyncio
+
+import pytest
+
+from mcp_server import server
+
+ROWS = [
+    {"id": f"t{day}", "date": f"2026-01-{day:02d}", "amount": -1.0 * day, "extra": True}
+    for day in range(1, 21)
+]
+
+
+class FakeBridge:
+    """Stands in for ActualBridgeClient, filtering ROWS like the bridge would"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def query_transactions(self, accounts=(), category=None, start_date=None,
+                                 end_date=None, min_amount=None, max_amount=None,
+                                 search=None, limit=100):
+        self.calls.append((start_date, end_date, limit))
+        await asyncio.sleep(0)
+        return [row for row in ROWS if server._in_range(row, start_date, end_date)][:limit]
+
+
+@pytest.fixture(autouse=True)
+def batch_window(monkeypatch):
+    monkeypatch.setattr(server, "QUERY_BATCH_WINDOW", 0.01)
+
+
+def fetch(bridge, start_date, end_date, limit, shape="shape"):
+    return server._fetch_transactions_batched(bridge, shape, start_date, end_date, limit, {})
+
+
+def ids(rows):
+    return [row["id"] for row in rows]
+
+
+def test_overlapping_ranges_share_one_bridge_call():
+    bridge = FakeBridge()
+
+    async def run():
+        return await asyncio.gather(
+            fetch(bridge, "2026-01-01", "2026-01-05", 100),
+            fetch(bridge, "2026-01-03", "2026-01-08", 100),
+        )
+
+    first, second = asyncio.run(run())
+    assert bridge.calls == [("2026-01-01", "2026-01-08", 200)]
+    assert ids(first) == ["t1", "t2", "t3", "t4", "t5"]
+    assert ids(second) == ["t3", "t4", "t5", "t6", "t7", "t8"]
+    # Rows are projected like a direct fetch
+    assert "extra" not in first[0]
+
+
+def test_each_caller_gets_its_own_limit():
+    bridge = FakeBridge()
+
+    async def run():
+        return await asyncio.gather(
+            fetch(bridge, "2026-01-01", "2026-01-05", 2),
+            fetch(bridge, "2026-01-04", "2026-01-08", 3),
+            fetch(bridge, None, "2026-01-02", 10),
+        )
+
+    first, second, third = asyncio.run(run())
+    assert bridge.calls == [(None, "2026-01-08", 15)]
+    assert ids(first) == ["t1", "t2"]
+    assert ids(second) == ["t4", "t5", "t6"]
+    assert ids(third) == ["t1", "t2"]
+
+
+def test_truncated_merge_falls_back_to_separate_calls():
+    bridge = FakeBridge()
+
+    async def run():
+        return await asyncio.gather(
+            fetch(bridge, "2026-01-01", "2026-01-10", 2),
+            fetch(bridge, "2026-01-05", "2026-01-20", 2),
+        )
+
+    first, second = asyncio.run(run())
+    # The merged call hit its limit, so each range was asked for on its own
+    assert bridge.calls[0] == ("2026-01-01", "2026-01-20", 4)
+    assert sorted(bridge.calls[1:]) == [("2026-01-01", "2026-01-10", 2), ("2026-01-05", "2026-01-20", 2)]
+    assert ids(first) == ["t1", "t2"]
+    assert ids(second) == ["t5", "t6"]
+
+
+def test_different_shapes_are_not_merged():
+    bridge = FakeBridge()
+
+    async def run():
+        return await asyncio.gather(
+            fetch(bridge, "2026-01-01", "2026-01-02", 100, shape="a"),
+            fetch(bridge, "2026-01-03", "2026-01-04", 100, shape="b"),
+        )
+
+    first, second = asyncio.run(run())
+    assert sorted(bridge.calls) == [("2026-01-01", "2026-01-02", 100), ("2026-01-03", "2026-01-04", 100)]
+    assert ids(first) == ["t1", "t2"]
+    assert ids(second) == ["t3", "t4"]
+
+
+def test_bridge_error_reaches_every_caller():
+    class FailingBridge(FakeBridge):
+        async def query_transactions(self, **filters):
+            raise RuntimeError("bridge down")
+
+    async def run():
+        return await asyncio.gather(
+            fetch(FailingBridge(), "2026-01-01", "2026-01-02", 100),
+            fetch(FailingBridge(), "2026-01-03", "2026-01-04", 100),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert [str(result) for result in results] == ["bridge down", "bridge down"]
+    assert not server._batch_tasks